@@ -9,8 +9,6 @@ import logging
 from pathlib import Path
 from typing import Tuple
 
-from ultralytics import YOLO
-
 from blackletter.config import RedactionConfig
 from blackletter.core.scanner import PDFScanner, Document
 from blackletter.core.planner import OpinionPlanner
@@ -28,6 +26,8 @@ class BlackletterPipeline:
 
     def __init__(self, config: RedactionConfig = None):
         self.config = config or RedactionConfig()
+        from ultralytics import YOLO
+
         logger.info(f"Using model: {self.config.MODEL_PATH}")
         self.model = YOLO(self.config.MODEL_PATH)
 
@@ -82,6 +82,19 @@ def main():
         help="Max page span for 'short' opinion (default: 2)",
     )
 
+    parser.add_argument(
+        "--fast-save",
+        action="store_true",
+        help="Save opinion PDFs without compression (faster, larger files)",
+    )
+
+    parser.add_argument(
+        "--extraction-workers",
+        type=int,
+        default=1,
+        help="Processes used to write masked opinions (default: 1, in-process)",
+    )
+
     args = parser.parse_args()
 
     if not args.pdf.exists():
@@ -94,6 +107,8 @@ def main():
             confidence_threshold=args.confidence,
             dpi=args.dpi,
             short_opinion_threshold=args.combine_threshold,
+            fast_save=args.fast_save,
+            extraction_workers=args.extraction_workers,
         )
 
         pipeline = BlackletterPipeline(config)
@@ -1,10 +1,17 @@
 """Configuration management for blackletter redaction pipeline."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 
 
+@lru_cache(maxsize=1)
+def _cached_model_path() -> str:
+    """Resolve the bundled model path once per process."""
+    return str(Path(__file__).parent / "models" / "best.pt")
+
+
 @dataclass
 class RedactionConfig:
     """Configuration for PDF redaction pipeline."""
@@ -13,9 +20,7 @@ class RedactionConfig:
 
     def __post_init__(self):
         """Resolve model path after initialization."""
-
-        root = Path(__file__).parent
-        self.MODEL_PATH: str = str(root / "models" / "best.pt")
+        self.MODEL_PATH: str = _cached_model_path()
 
     # Image processing
     dpi: int = 200
@@ -58,3 +63,7 @@ class RedactionConfig:
     # Opinion combining (extraction phase)
     combine_short_opinions: bool = False  # Enable grouping of short opinions
     short_opinion_threshold: int = 2  # Max page span to consider "short"
+
+    # Opinion PDF output
+    fast_save: bool = False  # Skip deflate and deep garbage collection when saving opinions
+    extraction_workers: int = 1  # Processes for masked extraction; 1 extracts in-process
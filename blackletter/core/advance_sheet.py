@@ -9,15 +9,14 @@ import logging
 import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import cv2
 import fitz
 import numpy as np
-import pdfplumber
-from google import genai
-from google.genai import types
-from ultralytics import YOLO
+
+if TYPE_CHECKING:
+    from ultralytics import YOLO
 
 logger = logging.getLogger(__name__)
 
@@ -151,6 +150,10 @@ class AdvanceSheetExtractor:
         if not self.config.prompt_path.exists():
             raise FileNotFoundError(f"Prompt file not found: {self.config.prompt_path}")
 
+        import pdfplumber
+        from google import genai
+        from google.genai import types
+
         client = genai.Client(api_key=api_key)
         system_prompt = self.config.prompt_path.read_text(encoding="utf-8")
 
@@ -189,7 +192,7 @@ class AdvanceSheetExtractor:
 class SectionScanner:
     """Detects TOC/header pages and returns the longest runs (spans)."""
 
-    def __init__(self, config: AdvanceSheetConfig, model: YOLO):
+    def __init__(self, config: AdvanceSheetConfig, model: "YOLO"):
         self.config = config
         self.model = model
 
@@ -202,6 +205,8 @@ class SectionScanner:
         :param pdf_path: path to PDF to scan
         :return: (toc_flags, header_flags, toc_span, header_span)
         """
+        import pdfplumber
+
         toc_spans: List[List[int]] = []
         opinion_pages: List[bool] = []
         toc_section = []
@@ -349,7 +354,7 @@ class PDFExtractor:
 # ================= MAIN =================
 def scan_splitter(
     target_file: Path,
-    model: YOLO,
+    model: "YOLO",
     output_dir: Path | str,
     base_dir: Optional[Path] = None,
     metadata: Optional[List[Dict]] = None,
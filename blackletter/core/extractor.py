@@ -1,18 +1,127 @@
 """Phase 4: Extract and mask opinions into separate PDFs."""
 
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
 from pathlib import Path
-from typing import List
+from typing import List, Set, Tuple
 
 import fitz
 
 from blackletter import Document
 from blackletter.config import RedactionConfig
-from blackletter.core.scanner import Opinion
+from blackletter.core.scanner import Detection, Opinion, PageContext
 
 logger = logging.getLogger(__name__)
 
 
+def _save_options(config: RedactionConfig) -> dict:
+    """Keyword arguments for saving an extracted opinion PDF.
+
+    ``fast_save`` skips deflate and duplicate-object merging, trading larger
+    files for much quicker saves, which suits pipelines that compress the
+    output in a later stage. Unused objects are still dropped and the xref
+    compacted.
+
+    :param config: redaction configuration
+    :return: keyword arguments for ``fitz.Document.save``
+    """
+    if config.fast_save:
+        return {"garbage": 2, "deflate": False}
+    return {"garbage": 4, "deflate": True}
+
+
+def _layout_only(document: Document) -> Document:
+    """Copy a document keeping only what masking needs, so it can be pickled.
+
+    :param document: fully scanned document
+    :return: document whose pages carry layout info but no images or pdfplumber handles
+    """
+    pages = [replace(page, plumber_page=None, img=None, page_objects=[]) for page in document.pages]
+    return Document(pages=pages, first_page=document.first_page)
+
+
+# Per-process extraction state, set up once by _init_worker
+_worker: dict = {}
+
+
+def _init_worker(
+    src_pdf_path: Path,
+    layout: Document,
+    filler_pages: Set[int],
+    reduce: bool,
+    config: RedactionConfig,
+) -> None:
+    """Open the source PDF and store the shared extraction inputs for this process.
+
+    :param src_pdf_path: path to the redacted source PDF
+    :param layout: document carrying page layout information
+    :param filler_pages: page indices to drop when reducing
+    :param reduce: whether to remove fully redacted pages
+    :param config: redaction configuration
+    :return: None
+    """
+    _worker.update(
+        src=fitz.open(src_pdf_path),
+        layout=layout,
+        filler_pages=filler_pages,
+        reduce=reduce,
+        extractor=OpinionExtractor(config),
+        save_options=_save_options(config),
+    )
+
+
+def _close_worker() -> None:
+    """Release the state set up by _init_worker.
+
+    :return: None
+    """
+    src = _worker.pop("src", None)
+    if src is not None:
+        src.close()
+    _worker.clear()
+
+
+def _extract_one_opinion(masked_fp: Path, group: List[Opinion]) -> str:
+    """Extract and mask a single opinion group into its own PDF.
+
+    Expects _init_worker to have run in this process, so pages are copied from
+    the process's own handle on the source PDF.
+
+    :param masked_fp: where to write the masked opinion PDF
+    :param group: opinions to extract together
+    :return: name of the file written, without extension
+    """
+    extractor = _worker["extractor"]
+    layout = _worker["layout"]
+    start_pg_idx = group[0].caption.page_index
+    end_pg_idx = group[-1].key.page_index
+
+    # Create PDF with only this opinion's pages
+    doc_out = fitz.open()
+    doc_out.insert_pdf(_worker["src"], from_page=start_pg_idx, to_page=end_pg_idx)
+
+    # Apply masking
+    if len(group) == 1:
+        extractor._apply_opinion_masking(doc_out, group[0], layout)
+    else:
+        extractor._apply_group_masking(doc_out, group, layout)
+
+    if _worker["reduce"] == True:
+        # Remove pages that are fully redacted to shrink file size
+        for pg_idx in sorted(_worker["filler_pages"], reverse=True):
+            if start_pg_idx <= pg_idx <= end_pg_idx:
+                local_idx = pg_idx - start_pg_idx
+                doc_out.delete_page(local_idx)
+
+    doc_out.save(str(masked_fp), **_worker["save_options"])
+    doc_out.close()
+
+    return masked_fp.stem
+
+
 class OpinionExtractor:
     """Extracts opinions into separate PDFs with optional masking."""
 
@@ -120,7 +229,7 @@ class OpinionExtractor:
             doc_out = fitz.open()
             doc_out.insert_pdf(src, from_page=start_pg_idx, to_page=end_pg_idx)
 
-            doc_out.save(str(redacted_fp), garbage=4, deflate=True)
+            doc_out.save(str(redacted_fp), **_save_options(self.config))
             doc_out.close()
 
             logger.info(f"Extracted to redacted/: {case_name}")
@@ -146,8 +255,6 @@ class OpinionExtractor:
         masked_dir = src_pdf_path.parent / "masked"
         masked_dir.mkdir(parents=True, exist_ok=True)
 
-        src = fitz.open(src_pdf_path)
-
         # Group opinions if combine_short is enabled
         if combine_short:
             opinion_groups = self._group_opinions(document.opinions)
@@ -156,40 +263,45 @@ class OpinionExtractor:
 
         logger.info(f"Extracting {len(opinion_groups)} opinion file(s)")
 
+        layout = _layout_only(document)
+        filler_pages = document.get_filler_pages()
+
+        tasks = []
         for group in opinion_groups:
             if len(group) == 1:
                 case_name = group[0].case_name
             else:
                 case_name = f"{group[0].case_name}_to_{group[-1].case_name}"
 
-            start_pg_idx = group[0].caption.page_index
-            end_pg_idx = group[-1].key.page_index
             masked_fp = masked_dir / f"{case_name}.pdf"
+            tasks.append((masked_fp, group))
 
-            # Create PDF with only this opinion's pages
-            doc_out = fitz.open()
-            doc_out.insert_pdf(src, from_page=start_pg_idx, to_page=end_pg_idx)
-
-            # Apply masking
-            if len(group) == 1:
-                self._apply_opinion_masking(doc_out, group[0], document)
-            else:
-                self._apply_group_masking(doc_out, group, document)
-
-            if reduce == True:
-                # Remove pages that are fully redacted to shrink file size
-                filler_pages = document.get_filler_pages()
-                for pg_idx in sorted(filler_pages, reverse=True):
-                    if start_pg_idx <= pg_idx <= end_pg_idx:
-                        local_idx = pg_idx - start_pg_idx
-                        doc_out.delete_page(local_idx)
+        init_args = (src_pdf_path, layout, filler_pages, reduce, self.config)
 
-            doc_out.save(str(masked_fp), garbage=4, deflate=True)
-            doc_out.close()
+        # Each worker process costs far more to start than one opinion takes to
+        # save, so the pool is opt-in and never larger than the work available
+        workers = min(self.config.extraction_workers, os.cpu_count() or 1, len(tasks))
 
-            logger.info(f"Extracted: {case_name}")
+        if workers <= 1:
+            _init_worker(*init_args)
+            try:
+                for task in tasks:
+                    logger.info(f"Extracted: {_extract_one_opinion(*task)}")
+            finally:
+                _close_worker()
+        else:
+            # Spawn rather than fork: the pipeline holds a loaded model with live
+            # thread pools that must not be forked
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=init_args,
+            ) as executor:
+                futures = [executor.submit(_extract_one_opinion, *task) for task in tasks]
+                for future in futures:
+                    logger.info(f"Extracted: {future.result()}")
 
-        src.close()
         logger.info(f"Saved {len(opinion_groups)} opinion file(s) to {masked_dir}")
         return masked_dir
 
@@ -209,62 +321,7 @@ class OpinionExtractor:
 
         :return: None
         """
-        scale = 72 / self.config.dpi
-        p_start = doc_out[0]
-        p_end = doc_out[-1]
-        start_pg_idx = opinion.caption.page_index
-        end_pg_idx = opinion.key.page_index
-        start_y_px = opinion.caption.coords[1]
-        end_y_px = opinion.key.coords[3]
-        start_col = opinion.caption.col
-        end_col = opinion.key.col
-
-        def safe_redact(page, rect):
-            """Safely add redaction if rect is valid."""
-            if rect.y1 > rect.y0 and rect.x1 > rect.x0:
-                page.add_redact_annot(rect, fill=self.config.mask_color)
-
-        # === START PAGE ===
-        W_start, H_start = p_start.rect.width, p_start.rect.height
-        split_start = document.pages[start_pg_idx].midpoint * scale
-        sy_pt = start_y_px * scale
-        hy_start = (document.pages[start_pg_idx].header_bottom * scale) + 2
-        if document.pages[start_pg_idx].footer_top:
-            fy_start = (document.pages[start_pg_idx].footer_top * scale) + 2
-        else:
-            fy_start = H_start
-
-        if start_col == "LEFT":
-            # Mask right column and everything above opinion on left
-            safe_redact(p_start, fitz.Rect(0, hy_start, split_start, min(sy_pt, fy_start)))
-        elif start_col == "RIGHT":
-            # Mask left column and everything above opinion on right
-            safe_redact(p_start, fitz.Rect(0, hy_start, split_start, fy_start))
-            safe_redact(p_start, fitz.Rect(split_start, hy_start, W_start, min(sy_pt, fy_start)))
-
-        # === END PAGE ===
-        W_end, H_end = p_end.rect.width, p_end.rect.height
-        split_end = document.pages[end_pg_idx].midpoint * scale
-
-        ey_pt = end_y_px * scale
-        hy_end = (document.pages[end_pg_idx].header_bottom * scale) + 2
-
-        if document.pages[end_pg_idx].footer_top:
-            fy_end = (document.pages[end_pg_idx].footer_top * scale) + 2
-        else:
-            fy_end = H_end
-
-        if end_col == "LEFT":
-            # Mask right column and everything below opinion on left
-            safe_redact(p_end, fitz.Rect(0, ey_pt, split_end, fy_end))
-            safe_redact(p_end, fitz.Rect(split_end, hy_end, W_end, fy_end))
-        elif end_col == "RIGHT":
-            # Mask everything below opinion on right
-            safe_redact(p_end, fitz.Rect(split_end, ey_pt, W_end, fy_end))
-
-        # Apply all redactions
-        for page in doc_out:
-            page.apply_redactions()
+        self._mask_span(doc_out, opinion.caption, opinion.key, document)
 
     def _apply_group_masking(
         self,
@@ -282,57 +339,136 @@ class OpinionExtractor:
         :param document: document with layout info
         :return: None
         """
-        scale = 72 / self.config.dpi
+        self._mask_span(doc_out, opinion_group[0].caption, opinion_group[-1].key, document)
+
+    @staticmethod
+    def _safe_redact(page, rect, fill) -> None:
+        """Add a redaction to a page if the rect has positive area.
+
+        :param page: fitz page object
+        :param rect: fitz.Rect to redact
+        :param fill: fill color for the redaction
+        :return: None
+        """
+        if rect.y1 > rect.y0 and rect.x1 > rect.x0:
+            page.add_redact_annot(rect, fill=fill)
+
+    @staticmethod
+    def _page_bounds_pt(
+        page: PageContext,
+        scale: float,
+        page_height: float,
+    ) -> Tuple[float, float, float]:
+        """Convert a page's column split, header and footer lines to PDF points.
+
+        :param page: page context with layout information
+        :param scale: factor from image pixels to PDF points
+        :param page_height: PDF page height, used when there is no footer
+        :return: tuple of (split_x, header_y, footer_y)
+        """
+        split = page.midpoint * scale
+        header_y = (page.header_bottom * scale) + 2
+        if page.footer_top:
+            footer_y = (page.footer_top * scale) + 2
+        else:
+            footer_y = page_height
+        return split, header_y, footer_y
+
+    def _mask_span(
+        self,
+        doc_out,
+        start: Detection,
+        end: Detection,
+        document: Document,
+    ) -> None:
+        """Mask everything before ``start`` and after ``end`` on the extracted pages.
 
-        first_op = opinion_group[0]
-        last_op = opinion_group[-1]
+        :param doc_out: output document whose first/last pages hold start/end
+        :param start: detection where visible content begins
+        :param end: detection where visible content ends
+        :param document: document with layout info
+        :return: None
+        """
+        scale = 72 / self.config.dpi
+        mask_color = self.config.mask_color
+        safe_redact = self._safe_redact
 
-        start_pg_idx = first_op.caption.page_index
-        end_pg_idx = last_op.key.page_index
-        start_y_px = first_op.caption.coords[1]
-        end_y_px = last_op.key.coords[3]
-        start_col = first_op.caption.col
-        end_col = last_op.key.col
+        start_pg_idx = start.page_index
+        end_pg_idx = end.page_index
+        start_y_px = start.coords[1]
+        end_y_px = end.coords[3]
+        start_col = start.col
+        end_col = end.col
 
         p_start = doc_out[0]
         p_end = doc_out[-1]
 
-        def safe_redact(page, rect):
-            if rect.y1 > rect.y0 and rect.x1 > rect.x0:
-                page.add_redact_annot(rect, fill=self.config.mask_color)
-
         # === MASK START PAGE ===
         W_start, H_start = p_start.rect.width, p_start.rect.height
-        split_start = document.pages[start_pg_idx].midpoint * scale
+        start_bounds = self._page_bounds_pt(document.pages[start_pg_idx], scale, H_start)
+        split_start, hy_start, fy_start = start_bounds
         sy_pt = start_y_px * scale
-        hy_start = (document.pages[start_pg_idx].header_bottom * scale) + 2
-        if document.pages[start_pg_idx].footer_top:
-            fy_start = (document.pages[start_pg_idx].footer_top * scale) + 2
-        else:
-            fy_start = H_start
+        start_rects = []
 
         if start_col == "LEFT":
-            safe_redact(p_start, fitz.Rect(0, hy_start, split_start, min(sy_pt, fy_start)))
+            # Mask everything above opinion on left
+            start_rects.append((0, hy_start, split_start, min(sy_pt, fy_start)))
         elif start_col == "RIGHT":
-            safe_redact(p_start, fitz.Rect(0, hy_start, split_start, fy_start))
-            safe_redact(p_start, fitz.Rect(split_start, hy_start, W_start, min(sy_pt, fy_start)))
+            # Mask left column and everything above opinion on right
+            start_rects.append((0, hy_start, split_start, fy_start))
+            start_rects.append((split_start, hy_start, W_start, min(sy_pt, fy_start)))
 
         # === MASK END PAGE ===
         W_end, H_end = p_end.rect.width, p_end.rect.height
-        split_end = document.pages[end_pg_idx].midpoint * scale
-        ey_pt = end_y_px * scale
-        hy_end = (document.pages[end_pg_idx].header_bottom * scale) + 2
-        if document.pages[end_pg_idx].footer_top:
-            fy_end = (document.pages[end_pg_idx].footer_top * scale) + 2
+        if end_pg_idx == start_pg_idx:
+            # Single-page span: the bounds were just computed for this page
+            split_end, hy_end, fy_end = start_bounds
         else:
-            fy_end = H_end
+            split_end, hy_end, fy_end = self._page_bounds_pt(
+                document.pages[end_pg_idx], scale, H_end
+            )
+        ey_pt = end_y_px * scale
+        end_rects = []
 
         if end_col == "LEFT":
-            safe_redact(p_end, fitz.Rect(0, ey_pt, split_end, fy_end))
-            safe_redact(p_end, fitz.Rect(split_end, hy_end, W_end, fy_end))
+            # Mask right column and everything below opinion on left
+            end_rects.append((0, ey_pt, split_end, fy_end))
+            end_rects.append((split_end, hy_end, W_end, fy_end))
         elif end_col == "RIGHT":
-            safe_redact(p_end, fitz.Rect(split_end, ey_pt, W_end, fy_end))
+            # Mask everything below opinion on right
+            end_rects.append((split_end, ey_pt, W_end, fy_end))
 
-        # Apply all redactions
-        for page in doc_out:
+        # Only the first and last pages carry masks
+        if len(doc_out) > 1:
+            masked_pages = ((p_start, start_rects), (p_end, end_rects))
+        else:
+            masked_pages = ((p_start, start_rects + end_rects),)
+
+        for page, rects in masked_pages:
+            for rect in self._merge_adjacent_rects(rects):
+                safe_redact(page, fitz.Rect(rect), mask_color)
             page.apply_redactions()
+
+    @staticmethod
+    def _merge_adjacent_rects(rects: List[Tuple]) -> List[Tuple]:
+        """Merge rectangles on the same row that share a vertical edge.
+
+        :param rects: list of (x0, y0, x1, y1) tuples
+        :return: list with side-by-side rectangles combined into one
+        """
+        if not rects:
+            return rects
+
+        rects = sorted(rects, key=lambda r: (r[1], r[0]))
+        merged = [rects[0]]
+
+        for r in rects[1:]:
+            x0, y0, x1, y1 = r
+            mx0, my0, mx1, my1 = merged[-1]
+
+            if y0 == my0 and y1 == my1 and x0 == mx1:
+                merged[-1] = (mx0, my0, x1, my1)
+            else:
+                merged.append(r)
+
+        return merged
@@ -10,6 +10,9 @@ from blackletter.core.scanner import Detection, Opinion
 
 logger = logging.getLogger(__name__)
 
+# Labels that drive the opinion state machine
+_STATE_LABELS = frozenset({"caption", "line", "headmatter", "Key"})
+
 
 class OpinionState(Enum):
     """State machine for opinion detection."""
@@ -43,14 +46,19 @@ class OpinionPlanner:
         # State machine variables
         candidate_end_node = None
         current_state = OpinionState.WAIT_CAPTION
-        document.sort_all_objects()
+        # Page bounds are folded into the state machine sweep below
+        document.sort_all_objects(extract_bounds=False)
 
         current_opinion = None
         # State machine - process objects in order
         for page in document.pages:
             for obj in page.page_objects:
                 label = obj.label
-                if label not in ["caption", "line", "headmatter", "Key"]:
+                if label == "header" or label == "footnotes":
+                    page.update_bounds(obj)
+                    continue
+
+                if label not in _STATE_LABELS:
                     continue
 
                 # LOCKED: waiting for Key to end the opinion
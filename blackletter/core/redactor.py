@@ -1,11 +1,11 @@
 """Phase 3: Apply redactions to PDF."""
 
 import logging
+from collections import defaultdict
 from pathlib import Path
-from typing import Tuple
+from typing import Dict, List, Optional, Tuple
 
 import fitz
-import pdfplumber
 
 from blackletter import Document
 from blackletter.config import RedactionConfig
@@ -14,6 +14,9 @@ from blackletter.utils.text import redact_text_lines_in_window
 
 logger = logging.getLogger(__name__)
 
+# Detections that are redacted as plain boxes
+_OBJ_REDACT_LABELS = frozenset({"line", "Key", "brackets", "order"})
+
 
 class TextRedactor:
     """Handles text-level redactions within windows."""
@@ -21,7 +24,22 @@ class TextRedactor:
     def __init__(self, config: RedactionConfig):
         self.config = config
 
-    def redact_text_window(self, page_pl, page_fitz, win_pdf: Tuple[float, float, float, float]):
+    def extract_words(self, page_pl) -> List[Dict]:
+        """Extract all words on a page once, for reuse across windows."""
+        return page_pl.extract_words(
+            x_tolerance=self.config.word_x_tolerance,
+            y_tolerance=self.config.word_y_tolerance,
+            use_text_flow=False,
+            keep_blank_chars=False,
+        )
+
+    def redact_text_window(
+        self,
+        page_pl,
+        page_fitz,
+        win_pdf: Tuple[float, float, float, float],
+        words: Optional[List[Dict]] = None,
+    ):
         """Redact text lines within a window using pdfplumber."""
         redact_text_lines_in_window(
             page_pl=page_pl,
@@ -30,6 +48,7 @@ class TextRedactor:
             pad=self.config.text_pad,
             y_tol=self.config.y_tolerance,
             merge_gap=self.config.merge_gap,
+            words=words,
         )
 
 
@@ -52,11 +71,22 @@ class PDFRedactor:
 
         :return: path to redacted PDF
         """
+        import pdfplumber
+
         logger.info("Starting PHASE 3: Applying redactions")
 
         pdf_path = Path(document.pdf_path)
         doc = fitz.open(pdf_path)
 
+        # Bucket opinions by the pages they span so each page only sees its own
+        opinions_by_page = defaultdict(list)
+        for opinion in document.opinions:
+            end = opinion.line or opinion.headmatter
+            if end is None:
+                continue
+            for page_idx in range(opinion.caption.page_index, end.page_index + 1):
+                opinions_by_page[page_idx].append(opinion)
+
         with pdfplumber.open(pdf_path) as pdf_read:
             for page in document.pages:
                 page_fitz = doc[page.index]
@@ -68,7 +98,7 @@ class PDFRedactor:
                     page_pl,
                     # redaction_instructions,
                     page,
-                    document.opinions,
+                    opinions_by_page[page.index],
                 )
 
                 self._apply_object_redactions(page_fitz, page_pl, page)
@@ -89,13 +119,18 @@ class PDFRedactor:
         page_pl,
         instr: Opinion,
         page: PageContext,
+        words: Optional[List[Dict]] = None,
     ) -> None:
         """Apply a single redaction instruction.
 
+        The instruction must span ``page``; callers are expected to have
+        bucketed instructions by page beforehand.
+
         :param page_fitz: fitz page object
         :param page_pl: pdfplumber page object
         :param instr: opinion instruction containing caption and line/headmatter spans
         :param page: page context with layout and scaling information
+        :param words: words extracted from the whole page, if already available
         :return: None
         """
         start = instr.caption
@@ -115,6 +150,7 @@ class PDFRedactor:
         ceiling_y = page.header_bottom
         limit_bottom_left = page.footer_top or page.img_height - 60
         limit_bottom_right = page.footer_top or page.img_height - 60
+        redact_text_window = self.text_redactor.redact_text_window
 
         def do_column_box(
             y_top_px: int,
@@ -143,10 +179,11 @@ class PDFRedactor:
             y0_pdf = y_top_px * scale_y
             y1_pdf = y_bottom_px * scale_y
 
-            self.text_redactor.redact_text_window(
+            redact_text_window(
                 page_pl=page_pl,
                 page_fitz=page_fitz,
                 win_pdf=(x0_pdf, y0_pdf, x1_pdf, y1_pdf),
+                words=words,
             )
 
         s_col = start.col == "LEFT"
@@ -181,7 +218,7 @@ class PDFRedactor:
                 do_column_box(sy, 9999, False)
 
         # Case 4: Middle page (between start and end)
-        elif start.page_index < page_idx and end.page_index > page_idx:
+        else:
             do_column_box(0, 9999, True)
             do_column_box(0, 9999, False)
 
@@ -197,15 +234,22 @@ class PDFRedactor:
         :param page_fitz: fitz page object
         :param page_pl: pdfplumber page object
         :param page: page context with layout and scaling information
-        :param opinions: list of opinion instructions to apply
+        :param opinions: opinion instructions spanning this page
         :return: None
         """
+        if not opinions:
+            return
+
+        # Extract once and let every window filter the same word list
+        words = self.text_redactor.extract_words(page_pl)
+
         for opinion in opinions:
             self._apply_instruction(
                 page_fitz,
                 page_pl,
                 opinion,
                 page,
+                words,
             )
 
     def _apply_object_redactions(
@@ -233,7 +277,7 @@ class PDFRedactor:
         for o in objs_on_page:
             label = o.label
 
-            if label in ["line", "Key", "brackets", "order"]:
+            if label in _OBJ_REDACT_LABELS:
                 c = [int(x) for x in o.coords]
                 self._add_redaction_box(page_fitz, c[0], c[1], c[2], c[3], scale_x, scale_y)
 
@@ -293,7 +337,11 @@ class PDFRedactor:
         if y2 <= y1 or x2 <= x1:
             return
 
-        rx1, ry1 = x1 * scale_x, y1 * scale_y
-        rx2, ry2 = x2 * scale_x, y2 * scale_y
+        # Clip to the page and skip boxes that lie entirely outside it
+        page_rect = page_fitz.rect
+        rx1, ry1 = max(x1 * scale_x, page_rect.x0), max(y1 * scale_y, page_rect.y0)
+        rx2, ry2 = min(x2 * scale_x, page_rect.x1), min(y2 * scale_y, page_rect.y1)
+        if rx2 <= rx1 or ry2 <= ry1:
+            return
 
         page_fitz.add_redact_annot(fitz.Rect(rx1, ry1, rx2, ry2), fill=self.config.redaction_fill)
@@ -2,20 +2,26 @@
 
 import logging
 
-from typing import Dict, List, Tuple, Optional, Set
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
 
 import cv2
 import numpy as np
-import pdfplumber
-from ultralytics import YOLO
 
 from blackletter.config import RedactionConfig
 from blackletter.utils import processing
 
+if TYPE_CHECKING:
+    from ultralytics import YOLO
+
 logger = logging.getLogger(__name__)
 
+# Reading order of columns on a page; unknown columns sort last
+_COL_ORDER = {"LEFT": 0, "RIGHT": 1}
+_COL_ORDER_UNKNOWN = len(_COL_ORDER)
+
 
 @dataclass
 class Detection:
@@ -62,13 +68,21 @@ class PageContext:
     def extract_bounds(self):
         """Extract header and footer bounds from page_objects."""
         for obj in self.page_objects:
-            if obj.label == "header":
-                self.header_bottom = obj.coords[3]
-            elif obj.label == "footnotes":
-                if self.footer_top is None:
-                    self.footer_top = obj.coords[1]
-                else:
-                    self.footer_top = min(self.footer_top, obj.coords[1])
+            self.update_bounds(obj)
+
+    def update_bounds(self, obj: Detection) -> None:
+        """Fold a single header or footnotes detection into the page bounds.
+
+        :param obj: detection on this page; other labels are ignored
+        :return: None
+        """
+        if obj.label == "header":
+            self.header_bottom = obj.coords[3]
+        elif obj.label == "footnotes":
+            if self.footer_top is None:
+                self.footer_top = obj.coords[1]
+            else:
+                self.footer_top = min(self.footer_top, obj.coords[1])
 
     @property
     def page_dimensions(self):
@@ -95,14 +109,24 @@ class Document:
     reporter: Optional[str] = None
     first_page: Optional[int] = 1
 
-    def sort_all_objects(self) -> None:
+    def sort_all_objects(self, extract_bounds: bool = True) -> None:
         """Sort page_objects on each page by column and y position.
 
+        :param extract_bounds: also derive header/footer bounds for each page;
+            callers already walking the sorted objects can do this themselves
         :return: None
         """
         for page in self.pages:
-            page.page_objects = sorted(page.page_objects, key=lambda o: (o.col, o.coords[1]))
-            page.extract_bounds()
+            objs = page.page_objects
+            # Decorate with plain tuples so the sort compares ints/floats only
+            keys = [
+                (_COL_ORDER.get(o.col, _COL_ORDER_UNKNOWN), o.coords[1], i)
+                for i, o in enumerate(objs)
+            ]
+            keys.sort()
+            page.page_objects = [objs[k[2]] for k in keys]
+            if extract_bounds:
+                page.extract_bounds()
 
     def add_opinion(
         self, start: Detection, end: Detection, midpoint: Optional[Detection] = None
@@ -124,16 +148,20 @@ class Document:
         if not self.opinions:
             return
 
-        COL_ORDER = {"LEFT": 0, "RIGHT": 1}
-
-        def sort_key(opinion):
-            start = opinion.caption
-            page = start.page_index
-            col = COL_ORDER.get(start.col, 99)
-            y1 = start.coords[1]
-            return (page, col, y1)
-
-        self.opinions.sort(key=sort_key)
+        # Materialize (page, col, y1) once and sort on the tuple alone
+        decorated = [
+            (
+                (
+                    op.caption.page_index,
+                    _COL_ORDER.get(op.caption.col, _COL_ORDER_UNKNOWN),
+                    op.caption.coords[1],
+                ),
+                op,
+            )
+            for op in self.opinions
+        ]
+        decorated.sort(key=itemgetter(0))
+        self.opinions[:] = [op for _, op in decorated]
 
         page_counter = {}
         for opinion in self.opinions:
@@ -178,9 +206,13 @@ class PDFScanner:
         "footnotes",
     }
 
-    def __init__(self, config: RedactionConfig, model: YOLO = None):
+    def __init__(self, config: RedactionConfig, model: "YOLO" = None):
         self.config = config
-        self.model = model or YOLO(config.MODEL_PATH)
+        if model is None:
+            from ultralytics import YOLO
+
+            model = YOLO(config.MODEL_PATH)
+        self.model = model
 
     def scan(self, document: Document) -> Document:
         """Scan all pages and detect objects.
@@ -189,6 +221,8 @@ class PDFScanner:
 
         :return: A document with detected objects.
         """
+        import pdfplumber
+
         logger.info("Starting PHASE 1: Scanning all pages")
 
         total_detections = 0
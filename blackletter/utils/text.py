@@ -1,7 +1,7 @@
 """Text extraction and redaction utilities."""
 
 import logging
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from blackletter.config import RedactionConfig
 
 import fitz
@@ -19,6 +19,7 @@ def redact_text_lines_in_window(
     y_tol: float = 3.0,
     merge_gap: float = 2.5,
     min_h: float = 6.0,
+    words: Optional[List[Dict]] = None,
 ):
     """Redact text lines within a window using pdfplumber.
 
@@ -30,17 +31,24 @@ def redact_text_lines_in_window(
         y_tol: Y-tolerance for grouping words into lines
         merge_gap: Maximum gap for merging rectangles
         min_h: Minimum height for redaction
+        words: Words already extracted from the whole page; when given they
+            are filtered to the window instead of re-extracting from page_pl
     """
     x0, y0, x1, y1 = win_pdf
-    region = page_pl.crop((x0, y0, x1, y1))
-
-    # Extract words from window
-    words = region.extract_words(
-        x_tolerance=1,
-        y_tolerance=2,
-        use_text_flow=False,
-        keep_blank_chars=False,
-    )
+
+    if words is None:
+        # Extract words from window
+        region = page_pl.crop((x0, y0, x1, y1))
+        words = region.extract_words(
+            x_tolerance=1,
+            y_tolerance=2,
+            use_text_flow=False,
+            keep_blank_chars=False,
+        )
+    else:
+        words = [
+            w for w in words if w["x0"] < x1 and w["x1"] > x0 and w["top"] < y1 and w["bottom"] > y0
+        ]
 
     if not words:
         return
@@ -0,0 +1,133 @@
+"""Tests for opinion extraction helpers."""
+
+import pytest
+
+
+def test_merge_adjacent_rects_joins_side_by_side_masks():
+    """Masks on the same row that touch are emitted as one rectangle."""
+    from blackletter.core.extractor import OpinionExtractor
+
+    rects = [(300, 50, 612, 700), (0, 50, 300, 700)]
+
+    assert OpinionExtractor._merge_adjacent_rects(rects) == [(0, 50, 612, 700)]
+
+
+def test_merge_adjacent_rects_keeps_different_rows():
+    """Masks with different heights are left alone."""
+    from blackletter.core.extractor import OpinionExtractor
+
+    rects = [(0, 50, 300, 400), (300, 50, 612, 700)]
+
+    assert OpinionExtractor._merge_adjacent_rects(rects) == rects
+
+
+def test_fast_save_still_compacts_xref():
+    """fast_save skips compression but does not keep unused objects around."""
+    import fitz
+
+    from blackletter.config import RedactionConfig
+    from blackletter.core.extractor import _save_options
+
+    doc = fitz.open()
+    for i in range(30):
+        doc.new_page().insert_text((72, 72), f"Page {i}")
+    full_xref_length = doc.xref_length()
+    doc.select([0])
+
+    fast = fitz.open("pdf", doc.tobytes(**_save_options(RedactionConfig(fast_save=True))))
+    default = fitz.open("pdf", doc.tobytes(**_save_options(RedactionConfig())))
+
+    assert fast.xref_length() < full_xref_length // 4
+    assert fast.xref_length() == default.xref_length()
+
+
+def _masking_document(tmp_path, n_opinions=3):
+    """Build a redacted PDF and a document with one 3-page opinion per 3 pages."""
+    import fitz
+
+    from blackletter.core.scanner import Detection, Document, Opinion, PageContext
+
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    src_pdf_path = tmp_path / "src_redacted.pdf"
+    src = fitz.open()
+    for i in range(3 * n_opinions):
+        page = src.new_page()
+        page.insert_text((72, 50), f"Above {i}")
+        page.insert_text((72, 400), f"Body {i}")
+    src.save(src_pdf_path)
+    src.close()
+
+    def detection(page_index, label, y):
+        return Detection([100, y, 800, y + 30], 0.9, label, "LEFT", page_index)
+
+    pages = [
+        PageContext(None, None, i, 612, 792, 1700, 2200, midpoint=850, header_bottom=100)
+        for i in range(3 * n_opinions)
+    ]
+    opinions = []
+    for k in range(n_opinions):
+        opinion = Opinion(
+            caption=detection(3 * k, "caption", 600), key=detection(3 * k + 2, "Key", 1500)
+        )
+        opinion.case_name = f"0001-{k + 1:02d}"
+        opinions.append(opinion)
+
+    return Document(pages=pages, opinions=opinions, redacted_pdf_path=src_pdf_path)
+
+
+def _read_masked(masked_dir):
+    import fitz
+
+    texts = {}
+    for fp in sorted(masked_dir.iterdir()):
+        with fitz.open(fp) as doc:
+            texts[fp.name] = [page.get_text().split() for page in doc]
+    return texts
+
+
+def test_split_and_mask_opinions_in_process(tmp_path):
+    """The default path masks each opinion without a process pool."""
+    from blackletter.config import RedactionConfig
+    from blackletter.core.extractor import OpinionExtractor
+
+    document = _masking_document(tmp_path)
+
+    masked_dir = OpinionExtractor(RedactionConfig()).split_and_mask_opinions(document, reduce=False)
+
+    texts = _read_masked(masked_dir)
+    assert sorted(texts) == ["0001-01.pdf", "0001-02.pdf", "0001-03.pdf"]
+    # Text above the caption on the first page is masked, the body is kept
+    assert texts["0001-02.pdf"][0] == ["Body", "3"]
+    assert texts["0001-02.pdf"][1] == ["Above", "4", "Body", "4"]
+
+
+def test_split_and_mask_opinions_process_pool_matches_in_process(tmp_path, monkeypatch):
+    """Opting into worker processes produces the same files as the in-process path."""
+    from blackletter.config import RedactionConfig
+    from blackletter.core import extractor
+
+    document = _masking_document(tmp_path / "serial")
+    serial_dir = extractor.OpinionExtractor(RedactionConfig()).split_and_mask_opinions(
+        document, reduce=True
+    )
+
+    pools = []
+
+    class RecordingPool(extractor.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(kwargs["max_workers"])
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(extractor, "ProcessPoolExecutor", RecordingPool)
+    monkeypatch.setattr(extractor.os, "cpu_count", lambda: 8)
+
+    document = _masking_document(tmp_path / "pool")
+    config = RedactionConfig(extraction_workers=2)
+    pool_dir = extractor.OpinionExtractor(config).split_and_mask_opinions(document, reduce=True)
+
+    assert pools == [2]
+    assert _read_masked(pool_dir) == _read_masked(serial_dir)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,62 @@
+"""Tests for scanner data structures."""
+
+import pytest
+
+
+def _page(objects):
+    from blackletter.core.scanner import PageContext
+
+    return PageContext(
+        plumber_page=None,
+        img=None,
+        index=0,
+        pdf_pg_width=612,
+        pdf_pg_height=792,
+        img_width=1700,
+        img_height=2200,
+        page_objects=objects,
+    )
+
+
+def test_sort_all_objects_orders_by_column_then_y():
+    """Objects are ordered left column first, then top to bottom."""
+    from blackletter.core.scanner import Detection, Document
+
+    right_top = Detection(
+        coords=[900, 100, 1600, 150], confidence=0.9, label="caption", col="RIGHT"
+    )
+    left_low = Detection(coords=[100, 800, 800, 850], confidence=0.9, label="line", col="LEFT")
+    left_top = Detection(coords=[100, 200, 800, 250], confidence=0.9, label="caption", col="LEFT")
+    document = Document(pages=[_page([right_top, left_low, left_top])])
+
+    document.sort_all_objects()
+
+    assert document.pages[0].page_objects == [left_top, left_low, right_top]
+
+
+def test_assign_case_names_orders_by_page_column_and_y():
+    """Case names follow reading order and count up within a page."""
+    from blackletter.core.scanner import Detection, Document, Opinion
+
+    def caption(page_index, col, y1):
+        return Detection(
+            coords=[0, y1, 10, y1 + 10],
+            confidence=0.9,
+            label="caption",
+            col=col,
+            page_index=page_index,
+        )
+
+    later_page = Opinion(caption=caption(1, "LEFT", 100))
+    right = Opinion(caption=caption(0, "RIGHT", 50))
+    left = Opinion(caption=caption(0, "LEFT", 500))
+    document = Document(opinions=[later_page, right, left], first_page=10)
+
+    document.assign_case_names()
+
+    assert document.opinions == [left, right, later_page]
+    assert [op.case_name for op in document.opinions] == ["0010-01", "0010-02", "0011-01"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])